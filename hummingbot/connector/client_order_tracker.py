@@ -1,11 +1,11 @@
 import asyncio
+import heapq
 import logging
+import time
 from collections import defaultdict
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
-
-from cachetools import TTLCache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -28,6 +28,103 @@ if TYPE_CHECKING:
 
 cot_logger = None
 
+# Event tag and event class dispatch tables precomputed per trade type, so triggering an event is a single
+# dict lookup instead of re-evaluating the trade type conditionals on every order transition.
+_ORDER_CREATED_EVENTS: Dict[TradeType, Tuple[MarketEvent, Callable]] = {
+    trade_type: (MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent)
+    if trade_type is TradeType.BUY
+    else (MarketEvent.SellOrderCreated, SellOrderCreatedEvent)
+    for trade_type in TradeType
+}
+# Trade type display names are constant; precomputing them avoids a str.upper() allocation per log line.
+_TRADE_TYPE_UPPER: Dict[TradeType, str] = {trade_type: trade_type.name.upper() for trade_type in TradeType}
+_OPEN_ORDER_STATES = {
+    OrderState.PENDING_CREATE,
+    OrderState.OPEN,
+    OrderState.PARTIALLY_FILLED,
+    OrderState.PENDING_CANCEL,
+}
+_ORDER_COMPLETED_EVENTS: Dict[TradeType, Tuple[MarketEvent, Callable]] = {
+    trade_type: (MarketEvent.BuyOrderCompleted, BuyOrderCompletedEvent)
+    if trade_type is TradeType.BUY
+    else (MarketEvent.SellOrderCompleted, SellOrderCompletedEvent)
+    for trade_type in TradeType
+}
+
+
+class LazyTTLCache:
+    """
+    Minimal TTL-bound mapping backed by a plain dict plus a heap of (expiry, key) entries.
+
+    Expired entries are discarded lazily whenever the cache is accessed, so lookups and inserts stay
+    plain dict operations instead of the per-access linked-list maintenance cachetools.TTLCache
+    performs. Re-setting a key leaves a stale heap entry behind; it is skipped when it surfaces by
+    checking it against the live expiry. When the cache exceeds its maximum size the oldest inserted
+    entries are evicted first. An optional on_evict callback is invoked with (key, value) whenever an
+    entry is dropped by expiry or max-size eviction (not on explicit deletion), so owners can release
+    bookkeeping tied to the entry's lifetime.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, on_evict: Optional[Callable[[Any, Any], None]] = None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._on_evict = on_evict
+        self._map: Dict[Any, Tuple[Any, float]] = {}
+        self._heap: List[Tuple[float, Any]] = []
+
+    def __setitem__(self, key: Any, value: Any):
+        self._purge_expired()
+        expiry = time.monotonic() + self._ttl
+        if key in self._map:
+            # Re-insert so the key moves to the end of the dict's insertion order.
+            del self._map[key]
+        self._map[key] = (value, expiry)
+        heapq.heappush(self._heap, (expiry, key))
+        while len(self._map) > self._maxsize:
+            oldest_key = next(iter(self._map))
+            oldest_value, _ = self._map.pop(oldest_key)
+            if self._on_evict is not None:
+                self._on_evict(oldest_key, oldest_value)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._purge_expired()
+        return self._map[key][0]
+
+    def __delitem__(self, key: Any):
+        del self._map[key]
+
+    def __contains__(self, key: Any) -> bool:
+        self._purge_expired()
+        return key in self._map
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return len(self._map)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._purge_expired()
+        entry = self._map.get(key)
+        return default if entry is None else entry[0]
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        self._purge_expired()
+        return [(key, entry[0]) for key, entry in self._map.items()]
+
+    def values(self) -> List[Any]:
+        self._purge_expired()
+        return [entry[0] for entry in self._map.values()]
+
+    def _purge_expired(self):
+        now = time.monotonic()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._map.get(key)
+            if entry is not None and entry[1] == expiry:
+                del self._map[key]
+                if self._on_evict is not None:
+                    self._on_evict(key, entry[0])
+
 
 class ClientOrderTracker:
 
@@ -55,8 +152,11 @@ class ClientOrderTracker:
         self._connector: ConnectorBase = connector
         self._lost_order_count_limit = lost_order_count_limit
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
-        self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
+        self._cached_orders: LazyTTLCache = LazyTTLCache(
+            maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL, on_evict=self._handle_cached_order_eviction)
         self._lost_orders: Dict[str, InFlightOrder] = {}
+        # Secondary index for O(1) lookups by exchange order id; stale entries are dropped lazily on lookup.
+        self._exchange_ids_to_client_ids: Dict[str, str] = {}
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -142,6 +242,8 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        if order.exchange_order_id is not None:
+            self._exchange_ids_to_client_ids[order.exchange_order_id] = order.client_order_id
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -163,26 +265,89 @@ class ClientOrderTracker:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
 
+    def _handle_cached_order_eviction(self, client_order_id: str, order: InFlightOrder):
+        # The order just left the cache, so only the other two containers can still own it.
+        self._prune_exchange_order_id_index(order, check_cache=False)
+
+    def _prune_exchange_order_id_index(self, order: InFlightOrder, check_cache: bool = True):
+        """
+        Drops the exchange-id index entry for an order once it no longer lives in any tracking
+        container, keeping the index bounded by the tracked-order containers instead of growing by one
+        entry per order ever tracked.
+        """
+        exchange_order_id = order.exchange_order_id
+        if (exchange_order_id is None
+                or self._exchange_ids_to_client_ids.get(exchange_order_id) != order.client_order_id):
+            return
+        client_order_id = order.client_order_id
+        if client_order_id in self._in_flight_orders or client_order_id in self._lost_orders:
+            return
+        if check_cache and self._cached_orders.get(client_order_id) is not None:
+            return
+        del self._exchange_ids_to_client_ids[exchange_order_id]
+
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
 
     def fetch_cached_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._cached_orders.get(client_order_id, None)
 
+    def _fetch_fillable_order(self, client_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Looks up an order that could still receive fills (active, cached or lost) without building the
+        merged dict that the all_fillable_orders property allocates on every call.
+        """
+        order = self._in_flight_orders.get(client_order_id)
+        if order is None:
+            order = self._cached_orders.get(client_order_id)
+        if order is None:
+            order = self._lost_orders.get(client_order_id)
+        return order
+
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
         found_order = None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if client_order_id is not None:
+            found_order = self._in_flight_orders.get(client_order_id)
+            if found_order is None:
+                found_order = self._cached_orders.get(client_order_id)
+        if found_order is None and exchange_order_id is not None:
+            indexed_client_order_id = self._exchange_ids_to_client_ids.get(exchange_order_id)
+            if indexed_client_order_id is not None:
+                found_order = self._in_flight_orders.get(indexed_client_order_id)
+                if found_order is None:
+                    found_order = self._cached_orders.get(indexed_client_order_id)
+                if found_order is None and indexed_client_order_id not in self._lost_orders:
+                    # Dead entry; drop it so this id does not degrade to the scan below on every call.
+                    del self._exchange_ids_to_client_ids[exchange_order_id]
+            if found_order is None:
+                found_order = next(
+                    (
+                        order
+                        for order in chain(self._in_flight_orders.values(), self._cached_orders.values())
+                        if order.exchange_order_id == exchange_order_id
+                    ),
+                    None,
+                )
 
         return found_order
 
+    def fetch_order_by_exchange_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Resolves an order by its exchange order id through the secondary index, avoiding the O(n) scan
+        over all tracked orders. Covers active, cached and lost orders; stale index entries are dropped
+        when the lookup misses.
+        """
+        client_order_id = self._exchange_ids_to_client_ids.get(exchange_order_id)
+        if client_order_id is not None:
+            order = self._fetch_fillable_order(client_order_id)
+            if order is not None:
+                return order
+            del self._exchange_ids_to_client_ids[exchange_order_id]
+        return None
+
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
@@ -203,7 +368,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._fetch_fillable_order(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -218,6 +383,7 @@ class ClientOrderTracker:
                     fill_fee=trade_update.fee,
                     trade_id=trade_update.trade_id,
                     exchange_order_id=trade_update.exchange_order_id,
+                    timestamp=self.current_timestamp,
                 )
 
     async def process_order_not_found(self, client_order_id: str):
@@ -288,11 +454,16 @@ class ClientOrderTracker:
                     )
 
             previous_state: OrderState = tracked_order.current_state
+            previous_exchange_order_id: Optional[str] = tracked_order.exchange_order_id
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            if tracked_order.exchange_order_id is not None \
+                    and tracked_order.exchange_order_id != previous_exchange_order_id:
+                self._exchange_ids_to_client_ids[tracked_order.exchange_order_id] = tracked_order.client_order_id
             if updated:
-                self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
-                self._trigger_order_completion(tracked_order, order_update)
+                timestamp = self.current_timestamp
+                self._trigger_order_creation(tracked_order, previous_state, order_update.new_state, timestamp=timestamp)
+                self._trigger_order_completion(tracked_order, order_update, timestamp=timestamp)
         else:
             lost_order = self.fetch_lost_order(
                 client_order_id=order_update.client_order_id, exchange_order_id=order_update.exchange_order_id
@@ -301,16 +472,18 @@ class ClientOrderTracker:
                 if order_update.new_state in [OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED]:
                     # If the order officially reaches a final state after being lost it should be removed from the lost list
                     del self._lost_orders[lost_order.client_order_id]
+                    self._prune_exchange_order_id_index(lost_order)
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
-    def _trigger_created_event(self, order: InFlightOrder):
-        event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
-        event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
+    def _trigger_created_event(self, order: InFlightOrder, timestamp: Optional[float] = None):
+        if timestamp is None:
+            timestamp = self.current_timestamp
+        event_tag, event_class = _ORDER_CREATED_EVENTS[order.trade_type]
         self._connector.trigger_event(
             event_tag,
             event_class(
-                self.current_timestamp,
+                timestamp,
                 order.order_type,
                 order.trading_pair,
                 order.amount,
@@ -323,11 +496,13 @@ class ClientOrderTracker:
             ),
         )
 
-    def _trigger_cancelled_event(self, order: InFlightOrder):
+    def _trigger_cancelled_event(self, order: InFlightOrder, timestamp: Optional[float] = None):
+        if timestamp is None:
+            timestamp = self.current_timestamp
         self._connector.trigger_event(
             MarketEvent.OrderCancelled,
             OrderCancelledEvent(
-                timestamp=self.current_timestamp,
+                timestamp=timestamp,
                 order_id=order.client_order_id,
                 exchange_order_id=order.exchange_order_id,
             ),
@@ -341,11 +516,14 @@ class ClientOrderTracker:
         fill_fee: TradeFeeBase,
         trade_id: str,
         exchange_order_id: str,
+        timestamp: Optional[float] = None,
     ):
+        if timestamp is None:
+            timestamp = self.current_timestamp
         self._connector.trigger_event(
             MarketEvent.OrderFilled,
             OrderFilledEvent(
-                timestamp=self.current_timestamp,
+                timestamp=timestamp,
                 order_id=order.client_order_id,
                 trading_pair=order.trading_pair,
                 trade_type=order.trade_type,
@@ -360,18 +538,21 @@ class ClientOrderTracker:
             ),
         )
 
-    def _trigger_completed_event(self, order: InFlightOrder):
-        event_tag = (
-            MarketEvent.BuyOrderCompleted if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCompleted
-        )
-        event_class = BuyOrderCompletedEvent if order.trade_type is TradeType.BUY else SellOrderCompletedEvent
+    def _trigger_completed_event(self, order: InFlightOrder, timestamp: Optional[float] = None):
+        if timestamp is None:
+            timestamp = self.current_timestamp
+        event_tag, event_class = _ORDER_COMPLETED_EVENTS[order.trade_type]
+        # One split instead of the two the base_asset and quote_asset properties would perform.
+        pair_assets = order.trading_pair.split("-")
+        base_asset = pair_assets[0]
+        quote_asset = pair_assets[1]
         self._connector.trigger_event(
             event_tag,
             event_class(
-                self.current_timestamp,
+                timestamp,
                 order.client_order_id,
-                order.base_asset,
-                order.quote_asset,
+                base_asset,
+                quote_asset,
                 order.executed_amount_base,
                 order.executed_amount_quote,
                 order.order_type,
@@ -379,20 +560,30 @@ class ClientOrderTracker:
             ),
         )
 
-    def _trigger_failure_event(self, order: InFlightOrder):
+    def _trigger_failure_event(self, order: InFlightOrder, timestamp: Optional[float] = None):
+        if timestamp is None:
+            timestamp = self.current_timestamp
         self._connector.trigger_event(
             MarketEvent.OrderFailure,
             MarketOrderFailureEvent(
-                timestamp=self.current_timestamp,
+                timestamp=timestamp,
                 order_id=order.client_order_id,
                 order_type=order.order_type,
             ),
         )
 
-    def _trigger_order_creation(self, tracked_order: InFlightOrder, previous_state: OrderState, new_state: OrderState):
+    def _trigger_order_creation(
+        self,
+        tracked_order: InFlightOrder,
+        previous_state: OrderState,
+        new_state: OrderState,
+        timestamp: Optional[float] = None,
+    ):
         if previous_state == OrderState.PENDING_CREATE and new_state == OrderState.OPEN:
-            self.logger().info(tracked_order.build_order_created_message())
-            self._trigger_created_event(tracked_order)
+            logger = self.logger()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(tracked_order.build_order_created_message())
+            self._trigger_created_event(tracked_order, timestamp=timestamp)
 
     def _trigger_order_fills(self,
                              tracked_order: InFlightOrder,
@@ -401,12 +592,16 @@ class ClientOrderTracker:
                              fill_price: Decimal,
                              fill_fee: TradeFeeBase,
                              trade_id: str,
-                             exchange_order_id: str):
+                             exchange_order_id: str,
+                             timestamp: Optional[float] = None):
         if prev_executed_amount_base < tracked_order.executed_amount_base:
             self.logger().info(
-                f"The {tracked_order.trade_type.name.upper()} order {tracked_order.client_order_id} "
-                f"amounting to {tracked_order.executed_amount_base}/{tracked_order.amount} "
-                f"{tracked_order.base_asset} has been filled."
+                "The %s order %s amounting to %s/%s %s has been filled.",
+                _TRADE_TYPE_UPPER[tracked_order.trade_type],
+                tracked_order.client_order_id,
+                tracked_order.executed_amount_base,
+                tracked_order.amount,
+                tracked_order.base_asset,
             )
             self._trigger_filled_event(
                 order=tracked_order,
@@ -415,25 +610,59 @@ class ClientOrderTracker:
                 fill_fee=fill_fee,
                 trade_id=trade_id,
                 exchange_order_id=exchange_order_id,
+                timestamp=timestamp,
             )
 
-    def _trigger_order_completion(self, tracked_order: InFlightOrder, order_update: Optional[OrderUpdate] = None):
-        if tracked_order.is_open:
-            return
+    def _handle_cancelled_completion(
+        self, tracked_order: InFlightOrder, order_update: Optional[OrderUpdate], timestamp: Optional[float]
+    ):
+        self._trigger_cancelled_event(tracked_order, timestamp=timestamp)
+        self.logger().info("Successfully canceled order %s.", tracked_order.client_order_id)
 
-        if tracked_order.is_cancelled:
-            self._trigger_cancelled_event(tracked_order)
-            self.logger().info(f"Successfully canceled order {tracked_order.client_order_id}.")
+    def _handle_filled_completion(
+        self, tracked_order: InFlightOrder, order_update: Optional[OrderUpdate], timestamp: Optional[float]
+    ):
+        self._trigger_completed_event(tracked_order, timestamp=timestamp)
+        self.logger().info(
+            "%s order %s completely filled.",
+            _TRADE_TYPE_UPPER[tracked_order.trade_type],
+            tracked_order.client_order_id,
+        )
 
-        elif tracked_order.is_filled:
-            self._trigger_completed_event(tracked_order)
+    def _handle_failed_completion(
+        self, tracked_order: InFlightOrder, order_update: Optional[OrderUpdate], timestamp: Optional[float]
+    ):
+        if tracked_order.is_filled:
+            # The executed amount reached the order size even though the state is FAILED.
+            self._handle_filled_completion(tracked_order, order_update, timestamp)
+        else:
+            self._trigger_failure_event(tracked_order, timestamp=timestamp)
             self.logger().info(
-                f"{tracked_order.trade_type.name.upper()} order {tracked_order.client_order_id} completely filled."
+                "Order %s has failed. Order Update: %s", tracked_order.client_order_id, order_update
             )
 
-        elif tracked_order.is_failure:
-            self._trigger_failure_event(tracked_order)
-            self.logger().info(f"Order {tracked_order.client_order_id} has failed. Order Update: {order_update}")
+    _TERMINAL_STATE_HANDLERS: Dict[OrderState, Callable] = {
+        OrderState.CANCELED: _handle_cancelled_completion,
+        OrderState.FILLED: _handle_filled_completion,
+        OrderState.FAILED: _handle_failed_completion,
+    }
+
+    def _trigger_order_completion(
+        self,
+        tracked_order: InFlightOrder,
+        order_update: Optional[OrderUpdate] = None,
+        timestamp: Optional[float] = None,
+    ):
+        state = tracked_order.current_state
+        if state in _OPEN_ORDER_STATES:
+            return
+
+        handler = self._TERMINAL_STATE_HANDLERS.get(state)
+        if handler is not None:
+            handler(self, tracked_order, order_update, timestamp)
+        elif tracked_order.is_filled:
+            # Terminal states without a dedicated handler still complete when fully executed.
+            self._handle_filled_completion(tracked_order, order_update, timestamp)
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
@@ -44,14 +44,18 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionFeeCollected,
     ]
 
+    # Integer event tags resolved once at class load, so wiring the default listeners on each connector
+    # construction skips the per-event enum attribute lookups.
+    MARKET_EVENT_TAG_VALUES = [event_tag.value for event_tag in MARKET_EVENTS]
+
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
         self._event_logger = EventLogger(event_source=self.display_name)
-        for event_tag in self.MARKET_EVENTS:
-            self.c_add_listener(event_tag.value, self._event_reporter)
-            self.c_add_listener(event_tag.value, self._event_logger)
+        for event_tag_value in self.MARKET_EVENT_TAG_VALUES:
+            self.c_add_listener(event_tag_value, self._event_reporter)
+            self.c_add_listener(event_tag_value, self._event_logger)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -1,13 +1,19 @@
 import asyncio
+import csv
 import datetime
-import glob
+import logging
+import os
+import threading
+import time
 from pathlib import Path
+from typing import IO, Dict, Tuple
 
 import pandas as pd
 
 from hummingbot import data_path
 from hummingbot.core.data_type.common import OrderType, PositionAction, PositionSide
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
 from hummingbot.smart_components.executors.position_executor.data_types import PositionConfig
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase
@@ -16,6 +22,20 @@ from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
 class ExecutorHandlerBase:
+    _logger = None
+    # Number of control loop iterations between background refreshes of the closed executors summary.
+    SUMMARY_REFRESH_INTERVALS = 10
+    # Buffered executor records are flushed to CSV when this many rows are pending...
+    CSV_FLUSH_MAX_ROWS = 16
+    # ...or when the control loop finds the oldest pending row has waited this many seconds.
+    CSV_FLUSH_INTERVAL = 5.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
     def __init__(self, strategy: ScriptStrategyBase, controller: ControllerBase, update_interval: float = 1.0):
         """
         Initialize the ExecutorHandlerBase.
@@ -28,8 +48,21 @@ class ExecutorHandlerBase:
         self.controller = controller
         self.update_interval = update_interval
         self.terminated = asyncio.Event()
+        self._wake = asyncio.Event()
         self.level_executors = {level.level_id: None for level in self.controller.config.order_levels}
         self.status = ExecutorHandlerStatus.NOT_STARTED
+        self._data_dir = data_path()
+        self._csv_prefix = self.controller.get_csv_prefix()
+        self._csv_writers: Dict[str, Tuple[IO, csv.DictWriter]] = {}
+        self._pending_csv_rows: Dict[Path, list] = {}
+        self._pending_rows_count = 0
+        self._pending_since = 0.0
+        self._closed_executors_summary = None
+        self._summary_refresh_future = None
+        self._closed_executors_lock = threading.Lock()
+        self._closed_executors_df = None
+        self._closed_executors_dfs: Dict[str, pd.DataFrame] = {}
+        self._closed_executors_file_stats: Dict[str, Tuple[float, int]] = {}
 
     def start(self):
         """Start the executor handler."""
@@ -42,12 +75,23 @@ class ExecutorHandlerBase:
 
     def on_stop(self):
         """Actions to perform on stop."""
+        self._flush_pending_rows()
+        for file, _ in self._csv_writers.values():
+            file.close()
+        self._csv_writers = {}
         self.controller.stop()
 
     def on_start(self):
         """Actions to perform on start."""
         pass
 
+    def notify(self):
+        """
+        Signal the control loop that new work is available (e.g. new candles or order updates),
+        so it can run the control task immediately instead of waiting the full update interval.
+        """
+        self._wake.set()
+
     async def control_task(self):
         """Control task to be implemented by subclasses."""
         raise NotImplementedError
@@ -71,14 +115,43 @@ class ExecutorHandlerBase:
         if executor:
             csv_path = self.get_csv_path()
             executor_data = executor.to_json()
-            if not csv_path.exists():
-                headers = executor_data.keys()
-                df_header = pd.DataFrame(columns=headers)
-                df_header.to_csv(csv_path, mode='a', header=True, index=False)
-            df = pd.DataFrame([executor_data])
-            df.to_csv(csv_path, mode='a', header=False, index=False)
+            if self._pending_rows_count == 0:
+                self._pending_since = time.monotonic()
+            self._pending_csv_rows.setdefault(csv_path, []).append(executor_data)
+            self._pending_rows_count += 1
+            if self._pending_rows_count >= self.CSV_FLUSH_MAX_ROWS:
+                self._flush_pending_rows()
             self.level_executors[order_level.level_id] = None
 
+    def _flush_pending_rows(self):
+        """Write all buffered executor records to their CSVs in one writerows call per file."""
+        for csv_path, rows in self._pending_csv_rows.items():
+            if rows:
+                file, writer = self._get_csv_writer(csv_path, list(rows[0].keys()))
+                writer.writerows(rows)
+                file.flush()
+        self._pending_csv_rows = {}
+        self._pending_rows_count = 0
+
+    def _get_csv_writer(self, csv_path: Path, headers: list) -> Tuple[IO, csv.DictWriter]:
+        """
+        Get (or open and cache) the file handle and CSV writer for the given path, writing the header
+        when the file is created.
+
+        :param csv_path: Path of the CSV to write to.
+        :param headers: Field names to use when the file has to be created.
+        :return: Tuple of file handle and writer.
+        """
+        key = str(csv_path)
+        if key not in self._csv_writers:
+            write_header = not csv_path.exists()
+            file = open(csv_path, "a", newline="")
+            writer = csv.DictWriter(file, fieldnames=headers)
+            if write_header:
+                writer.writeheader()
+            self._csv_writers[key] = (file, writer)
+        return self._csv_writers[key]
+
     def create_executor(self, position_config: PositionConfig, order_level: OrderLevel):
         """
         Create an executor.
@@ -93,12 +166,39 @@ class ExecutorHandlerBase:
         """Main control loop."""
         self.on_start()
         self.status = ExecutorHandlerStatus.ACTIVE
+        iteration = 0
         while not self.terminated.is_set():
+            self._wake.clear()
+            if iteration % self.SUMMARY_REFRESH_INTERVALS == 0:
+                self._schedule_summary_refresh()
+            iteration += 1
             await self.control_task()
+            if self._pending_rows_count > 0 and time.monotonic() - self._pending_since > self.CSV_FLUSH_INTERVAL:
+                self._flush_pending_rows()
             await self._sleep(self.update_interval)
         self.status = ExecutorHandlerStatus.TERMINATED
         self.on_stop()
 
+    def _schedule_summary_refresh(self):
+        """
+        Refresh the closed executors summary on a background thread, so the CSV aggregation does not
+        block the control loop. Skips scheduling while a previous refresh is still running.
+        """
+        if self._summary_refresh_future is None or self._summary_refresh_future.done():
+            self._summary_refresh_future = asyncio.get_event_loop().run_in_executor(
+                None, self._refresh_closed_executors_summary)
+            self._summary_refresh_future.add_done_callback(self._log_summary_refresh_exception)
+
+    @classmethod
+    def _log_summary_refresh_exception(cls, future: asyncio.Future):
+        """Surface exceptions raised by the background summary refresh, which would otherwise be swallowed."""
+        if not future.cancelled() and future.exception() is not None:
+            cls.logger().error("Unexpected error refreshing the closed executors summary.",
+                               exc_info=future.exception())
+
+    def _refresh_closed_executors_summary(self):
+        self._closed_executors_summary = self.summarize_executors_df(self.get_closed_executors_df())
+
     def close_open_positions(self, connector_name: str = None, trading_pair: str = None):
         """
         Close all open positions.
@@ -118,11 +218,35 @@ class ExecutorHandlerBase:
                        position_action=PositionAction.CLOSE)
 
     def get_closed_executors_df(self):
-        dfs = [pd.read_csv(file) for file in glob.glob(data_path() + f"/{self.controller.get_csv_prefix()}*")]
-        if len(dfs) > 0:
-            df = pd.concat(dfs)
-            return self.controller.filter_executors_df(df)
-        return pd.DataFrame()
+        """
+        Get closed executors as a DataFrame, re-reading only the CSV files whose stat changed since the last call.
+        The per-file caches are shared with the background summary refresh, so access is serialized with a lock
+        and callers get a copy of the cached frame rather than the cached object itself.
+        """
+        with self._closed_executors_lock:
+            changed = False
+            current_files = set()
+            for entry in os.scandir(self._data_dir):
+                if not entry.name.startswith(self._csv_prefix):
+                    continue
+                file = entry.path
+                stats = entry.stat()
+                file_stat = (stats.st_mtime, stats.st_size)
+                current_files.add(file)
+                if self._closed_executors_file_stats.get(file) != file_stat:
+                    self._closed_executors_file_stats[file] = file_stat
+                    self._closed_executors_dfs[file] = pd.read_csv(file)
+                    changed = True
+            for file in set(self._closed_executors_dfs) - current_files:
+                del self._closed_executors_dfs[file]
+                del self._closed_executors_file_stats[file]
+                changed = True
+            if changed or self._closed_executors_df is None:
+                self._closed_executors_df = pd.concat(self._closed_executors_dfs.values()) \
+                    if self._closed_executors_dfs else pd.DataFrame()
+            if len(self._closed_executors_df) > 0:
+                return self.controller.filter_executors_df(self._closed_executors_df.copy())
+            return pd.DataFrame()
 
     def get_active_executors_df(self) -> pd.DataFrame:
         """
@@ -153,10 +277,13 @@ class ExecutorHandlerBase:
             executors_with_position = executors_df[executors_df["net_pnl"] != 0]
             total_executors_with_position = executors_with_position.shape[0]
             total_volume = executors_with_position["amount"].sum() * 2
-            total_long = (executors_with_position["side"] == "BUY").sum()
-            total_short = (executors_with_position["side"] == "SELL").sum()
-            correct_long = ((executors_with_position["side"] == "BUY") & (executors_with_position["net_pnl"] > 0)).sum()
-            correct_short = ((executors_with_position["side"] == "SELL") & (executors_with_position["net_pnl"] > 0)).sum()
+            is_long = executors_with_position["side"] == "BUY"
+            is_short = executors_with_position["side"] == "SELL"
+            is_win = executors_with_position["net_pnl"] > 0
+            total_long = is_long.sum()
+            total_short = is_short.sum()
+            correct_long = (is_long & is_win).sum()
+            correct_short = (is_short & is_win).sum()
             accuracy_long = correct_long / total_long if total_long > 0 else 0
             accuracy_short = correct_short / total_short if total_short > 0 else 0
 
@@ -186,13 +313,67 @@ class ExecutorHandlerBase:
             "accuracy_short": 0,
         }
 
+    @staticmethod
+    def summarize_executors_list(rows: list) -> dict:
+        """
+        Summarize executor records given as a list of executor.to_json() dicts, producing the same keys as
+        summarize_executors_df without building a DataFrame, which is cheaper for the handful of active
+        executors inspected on every status refresh.
+
+        :param rows: List of executor records.
+        :return: Summary dictionary.
+        """
+        net_pnl = 0.0
+        net_pnl_quote = 0.0
+        total_volume = 0.0
+        total_executors_with_position = 0
+        total_long = 0
+        total_short = 0
+        correct_long = 0
+        correct_short = 0
+        close_types = {}
+        for row in rows:
+            row_net_pnl = float(row["net_pnl"])
+            net_pnl += row_net_pnl
+            net_pnl_quote += float(row["net_pnl_quote"])
+            close_type = row["close_type"]
+            if close_type is not None:
+                close_types[close_type] = close_types.get(close_type, 0) + 1
+            if row_net_pnl != 0:
+                total_executors_with_position += 1
+                total_volume += float(row["amount"]) * 2
+                is_win = row_net_pnl > 0
+                if row["side"] == "BUY":
+                    total_long += 1
+                    correct_long += is_win
+                else:
+                    total_short += 1
+                    correct_short += is_win
+        return {
+            "net_pnl": net_pnl,
+            "net_pnl_quote": net_pnl_quote,
+            "total_executors": len(rows),
+            "total_executors_with_position": total_executors_with_position,
+            "total_volume": total_volume,
+            "total_long": total_long,
+            "total_short": total_short,
+            "close_types": close_types,
+            "accuracy_long": correct_long / total_long if total_long > 0 else 0,
+            "accuracy_short": correct_short / total_short if total_short > 0 else 0,
+        }
+
     def closed_executors_info(self):
-        closed_executors = self.get_closed_executors_df()
-        return self.summarize_executors_df(closed_executors)
+        """
+        Get the summary of closed executors, refreshed in the background by the control loop. The first
+        call (e.g. a status request before the loop populated the cache) computes it synchronously.
+        """
+        if self._closed_executors_summary is None:
+            self._refresh_closed_executors_summary()
+        return self._closed_executors_summary
 
     def active_executors_info(self):
-        active_executors = self.get_active_executors_df()
-        return self.summarize_executors_df(active_executors)
+        executors = [executor.to_json() for executor in self.level_executors.values() if executor]
+        return self.summarize_executors_list(executors)
 
     def to_format_status(self) -> str:
         """
@@ -233,6 +414,13 @@ Closed executors: {closed_executors_info["total_executors"]}
 
     async def _sleep(self, delay: float):
         """
+        Waits up to delay seconds, returning early if the handler is terminated or notified of new work.
+
         Method created to enable tests to prevent processes from sleeping
         """
-        await asyncio.sleep(delay)
+        waiters = [asyncio.create_task(self.terminated.wait()), asyncio.create_task(self._wake.wait())]
+        try:
+            await asyncio.wait(waiters, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
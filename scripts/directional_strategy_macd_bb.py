@@ -52,17 +52,18 @@ class MacdBB(DirectionalStrategyBase):
     candles = [CandlesFactory.get_candle(CandlesConfig(connector=exchange, trading_pair=trading_pair, interval="3m", max_records=1000))]
     markets = {exchange: {trading_pair}}
 
+    _cached_processed_df = None
+    _cached_last_candle = None
+    _cached_signal_inputs = None
+    _cached_signal_candle = None
+
     def get_signal(self):
         """
         Generates the trading signal based on the MACD and Bollinger Bands indicators.
         Returns:
             int: The trading signal (-1 for sell, 0 for hold, 1 for buy).
         """
-        candles_df = self.get_processed_df()
-        last_candle = candles_df.iloc[-1]
-        bbp = last_candle["BBP_100_2.0"]
-        macdh = last_candle["MACDh_21_42_9"]
-        macd = last_candle["MACD_21_42_9"]
+        bbp, macdh, macd = self._get_signal_inputs()
         if bbp < 0.4 and macdh > 0 and macd < 0:
             signal_value = 1
         elif bbp > 0.6 and macdh < 0 and macd > 0:
@@ -71,16 +72,44 @@ class MacdBB(DirectionalStrategyBase):
             signal_value = 0
         return signal_value
 
+    def _get_signal_inputs(self):
+        """
+        Retrieves the last-candle BBP, MACD histogram and MACD values, cached against the same last-candle
+        key as the processed dataframe so repeated signal evaluations on unchanged data skip the column
+        lookups.
+        Returns:
+            tuple: The (bbp, macdh, macd) scalars of the last candle.
+        """
+        candles_df = self.get_processed_df()
+        if self._cached_signal_inputs is None or self._cached_signal_candle != self._cached_last_candle:
+            self._cached_signal_inputs = (
+                candles_df["BBP_100_2.0"].iat[-1],
+                candles_df["MACDh_21_42_9"].iat[-1],
+                candles_df["MACD_21_42_9"].iat[-1],
+            )
+            self._cached_signal_candle = self._cached_last_candle
+        return self._cached_signal_inputs
+
     def get_processed_df(self):
         """
         Retrieves the processed dataframe with MACD and Bollinger Bands values.
+        The indicators are only recomputed when the last candle changes. Live feeds rewrite the forming
+        candle's values under the same timestamp on every update, so the cache is keyed on the last
+        candle's timestamp and close price; the signal and status paths still share one computation per
+        distinct last candle.
         Returns:
             pd.DataFrame: The processed dataframe with MACD and Bollinger Bands values.
         """
         candles_df = self.candles[0].candles_df
-        candles_df.ta.bbands(length=100, append=True)
-        candles_df.ta.macd(fast=21, slow=42, signal=9, append=True)
-        return candles_df
+        if len(candles_df) == 0:
+            return candles_df
+        last_candle = (candles_df["timestamp"].iat[-1], candles_df["close"].iat[-1])
+        if last_candle != self._cached_last_candle:
+            candles_df.ta.bbands(length=100, append=True)
+            candles_df.ta.macd(fast=21, slow=42, signal=9, append=True)
+            self._cached_processed_df = candles_df
+            self._cached_last_candle = last_candle
+        return self._cached_processed_df
 
     def market_data_extra_info(self):
         """
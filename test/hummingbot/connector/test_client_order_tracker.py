@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.client_order_tracker import ClientOrderTracker, LazyTTLCache
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -30,6 +30,76 @@ class MockExchange(ExchangeBase):
         return dict()
 
 
+class LazyTTLCacheUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.current_time = 0.0
+        self.evicted = []
+
+        monotonic_patcher = patch("hummingbot.connector.client_order_tracker.time.monotonic")
+        monotonic_mock = monotonic_patcher.start()
+        monotonic_mock.side_effect = lambda: self.current_time
+        self.addCleanup(monotonic_patcher.stop)
+
+        self.cache = LazyTTLCache(maxsize=3, ttl=10.0, on_evict=self._record_eviction)
+
+    def _record_eviction(self, key, value):
+        self.evicted.append((key, value))
+
+    def test_expired_entry_purged_on_access_and_fires_on_evict(self):
+        self.cache["someKey"] = "someValue"
+
+        self.current_time = 5.0
+        self.assertEqual("someValue", self.cache["someKey"])
+        self.assertEqual([], self.evicted)
+
+        self.current_time = 10.0
+        self.assertNotIn("someKey", self.cache)
+        self.assertEqual([("someKey", "someValue")], self.evicted)
+
+    def test_reset_key_survives_its_stale_heap_entry(self):
+        self.cache["someKey"] = "firstValue"
+        self.current_time = 5.0
+        self.cache["someKey"] = "secondValue"
+
+        # Past the first insertion's expiry: the stale heap entry must be skipped, not evict the key
+        self.current_time = 12.0
+        self.assertEqual("secondValue", self.cache["someKey"])
+        self.assertEqual([], self.evicted)
+
+        # Past the re-insertion's expiry the key finally expires
+        self.current_time = 15.0
+        self.assertNotIn("someKey", self.cache)
+        self.assertEqual([("someKey", "secondValue")], self.evicted)
+
+    def test_explicit_deletion_does_not_fire_on_evict(self):
+        self.cache["someKey"] = "someValue"
+
+        del self.cache["someKey"]
+
+        self.assertNotIn("someKey", self.cache)
+        self.assertEqual([], self.evicted)
+
+        # The deleted key's stale heap entry must not fire the callback when it surfaces either
+        self.current_time = 20.0
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual([], self.evicted)
+
+    def test_max_size_eviction_drops_oldest_inserted_key_first(self):
+        cache = LazyTTLCache(maxsize=2, ttl=10.0, on_evict=self._record_eviction)
+        cache["firstKey"] = "firstValue"
+        cache["secondKey"] = "secondValue"
+
+        # Re-setting a key moves it to the end of the eviction order
+        cache["firstKey"] = "newFirstValue"
+        cache["thirdKey"] = "thirdValue"
+
+        self.assertEqual([("secondKey", "secondValue")], self.evicted)
+        self.assertEqual("newFirstValue", cache["firstKey"])
+        self.assertEqual("thirdValue", cache["thirdKey"])
+
+
 class ClientOrderTrackerUnitTest(unittest.TestCase):
     # logging.Level required to receive logs from the exchange
     level = 0
@@ -267,6 +337,113 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertIsNone(fetched_order)
 
+    def test_fetch_order_by_exchange_id_returns_tracked_order(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        fetched_order: InFlightOrder = self.tracker.fetch_order_by_exchange_id(order.exchange_order_id)
+
+        self.assertTrue(fetched_order == order)
+
+    def test_exchange_order_id_indexed_when_it_arrives_in_order_update(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertNotIn("someExchangeOrderId", self.tracker._exchange_ids_to_client_ids)
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=order_update))
+
+        self.assertEqual(order.client_order_id, self.tracker._exchange_ids_to_client_ids["someExchangeOrderId"])
+        self.assertTrue(self.tracker.fetch_order_by_exchange_id("someExchangeOrderId") == order)
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_exchange_order_id_index_entry_removed_with_cached_order_expiration(self):
+        tracker = ClientOrderTracker(self.connector)
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertIn(order.exchange_order_id, tracker._exchange_ids_to_client_ids)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertNotIn(order.client_order_id, tracker.cached_orders)
+        self.assertNotIn(order.exchange_order_id, tracker._exchange_ids_to_client_ids)
+
+    def test_exchange_order_id_index_entry_removed_with_lost_order(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=1)
+
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.async_run_with_timeout(self.tracker.process_order_not_found(order.client_order_id))
+        self.async_run_with_timeout(self.tracker.process_order_not_found(order.client_order_id))
+
+        self.assertIn(order.client_order_id, self.tracker.lost_orders)
+        self.assertIn(order.exchange_order_id, self.tracker._exchange_ids_to_client_ids)
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=self.trading_pair,
+            update_timestamp=2,
+            new_state=OrderState.FAILED,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update=order_update))
+
+        self.assertNotIn(order.client_order_id, self.tracker.lost_orders)
+        self.assertNotIn(order.exchange_order_id, self.tracker._exchange_ids_to_client_ids)
+
+    def test_fetch_order_by_exchange_id_drops_dead_index_entry(self):
+        self.tracker._exchange_ids_to_client_ids["someExchangeOrderId"] = "someClientOrderId"
+
+        fetched_order = self.tracker.fetch_order_by_exchange_id("someExchangeOrderId")
+
+        self.assertIsNone(fetched_order)
+        self.assertNotIn("someExchangeOrderId", self.tracker._exchange_ids_to_client_ids)
+
     def test_process_order_update_invalid_order_update(self):
 
         order_creation_update: OrderUpdate = OrderUpdate(
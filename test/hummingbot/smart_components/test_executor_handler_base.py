@@ -1,4 +1,6 @@
 import random
+import tempfile
+from pathlib import Path
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -47,12 +49,16 @@ class TestExecutorHandlerBase(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(path.suffix, ".csv")
         self.assertIn("test_strategy", path.name)
 
-    @patch("pandas.DataFrame.to_csv", new_callable=MagicMock)
-    def test_store_executor(self, _):
+    def test_store_executor(self):
         mock_executor = MagicMock()
         mock_executor.to_json = MagicMock(return_value={"test": "test"})
         mock_order_level = MagicMock()
-        self.executor_handler.store_executor(mock_executor, mock_order_level)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "test_strategy.csv"
+            with patch.object(ExecutorHandlerBase, "get_csv_path", return_value=csv_path):
+                self.executor_handler.store_executor(mock_executor, mock_order_level)
+                self.executor_handler.on_stop()
+            self.assertTrue(csv_path.exists())
         self.assertIsNone(self.executor_handler.level_executors[mock_order_level.level_id])
 
     @patch.object(ExecutorHandlerBase, "_sleep", new_callable=AsyncMock)
@@ -63,6 +69,50 @@ class TestExecutorHandlerBase(IsolatedAsyncioWrapperTestCase):
             await self.executor_handler.control_loop()
         mock_control_task.assert_called()
 
+    def test_get_closed_executors_df_rereads_only_changed_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "test_strategy_closed.csv"
+            csv_path.write_text("net_pnl,amount\n0.1,10\n")
+            self.executor_handler._data_dir = tmp_dir
+            self.mock_controller.filter_executors_df.side_effect = lambda df: df
+
+            df = self.executor_handler.get_closed_executors_df()
+            self.assertEqual(1, len(df))
+
+            with patch("hummingbot.smart_components.strategy_frameworks.executor_handler_base.pd.read_csv",
+                       wraps=pd.read_csv) as read_csv_mock:
+                # Unchanged file: served from the cache without re-reading
+                df = self.executor_handler.get_closed_executors_df()
+                self.assertEqual(1, len(df))
+                read_csv_mock.assert_not_called()
+
+                # Appending a row changes the file's stat, so it is re-read
+                with csv_path.open("a") as file:
+                    file.write("0.2,20\n")
+                df = self.executor_handler.get_closed_executors_df()
+                self.assertEqual(2, len(df))
+                read_csv_mock.assert_called_once()
+
+            # A removed file drops out of the cache
+            csv_path.unlink()
+            df = self.executor_handler.get_closed_executors_df()
+            self.assertEqual(0, len(df))
+
+    def test_get_closed_executors_df_returns_copy_of_cached_frame(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "test_strategy_closed.csv"
+            csv_path.write_text("net_pnl,amount\n0.1,10\n")
+            self.executor_handler._data_dir = tmp_dir
+            self.mock_controller.filter_executors_df.side_effect = lambda df: df
+
+            df = self.executor_handler.get_closed_executors_df()
+
+            self.assertIsNot(df, self.executor_handler._closed_executors_df)
+
+            df["net_pnl"] = 0.0
+
+            self.assertEqual(0.1, self.executor_handler.get_closed_executors_df()["net_pnl"].iloc[0])
+
     @patch("hummingbot.smart_components.strategy_frameworks.executor_handler_base.PositionExecutor")
     def test_create_executor(self, mock_position_executor):
         mock_position_config = MagicMock()
@@ -96,6 +146,23 @@ class TestExecutorHandlerBase(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(summary["total_long"], (df[df["net_pnl"] != 0]["side"] == "BUY").sum())
         self.assertEqual(summary["total_short"], (df[df["net_pnl"] != 0]["side"] == "SELL").sum())
 
+    def test_summarize_executors_list_matches_df_summary(self):
+        df = self.generate_random_data(100)
+
+        df_summary = ExecutorHandlerBase.summarize_executors_df(df)
+        list_summary = ExecutorHandlerBase.summarize_executors_list(df.to_dict("records"))
+
+        self.assertAlmostEqual(df_summary["net_pnl"], list_summary["net_pnl"])
+        self.assertAlmostEqual(df_summary["net_pnl_quote"], list_summary["net_pnl_quote"])
+        self.assertEqual(df_summary["total_executors"], list_summary["total_executors"])
+        self.assertEqual(df_summary["total_executors_with_position"], list_summary["total_executors_with_position"])
+        self.assertAlmostEqual(df_summary["total_volume"], list_summary["total_volume"])
+        self.assertEqual(df_summary["total_long"], list_summary["total_long"])
+        self.assertEqual(df_summary["total_short"], list_summary["total_short"])
+        self.assertAlmostEqual(df_summary["accuracy_long"], list_summary["accuracy_long"])
+        self.assertAlmostEqual(df_summary["accuracy_short"], list_summary["accuracy_short"])
+        self.assertEqual(df_summary["close_types"].to_dict(), list_summary["close_types"])
+
     def test_close_open_positions(self):
         # Mocking the connector and its methods
         mock_connector = MagicMock()